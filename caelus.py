@@ -10,11 +10,446 @@ extensive modulation capabilities, and parameter ramping for timbral evolution.
 The system supports MIDI input and provides a comprehensive GUI for all parameters.
 """
 
-from pyo import *
-import mido
+from pyo import (
+    Adsr, CallAfter, Compress, Delay, HarmTable, Interp, Linseg, Mix, Osc,
+    Pan, Pattern, SLMap, Server, Sig, Sine,
+)
 import yaml
+import json
 import os
-from threading import Thread
+import time
+import logging
+import contextlib
+from collections import OrderedDict, deque
+
+# Prefer the libyaml-backed C loader/dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Optional faster preset backends, selected by preset file extension:
+# orjson speeds up .json presets (stdlib json otherwise), msgpack enables .msgpack
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+log = logging.getLogger("caelus")
+midi_log = logging.getLogger("caelus.midi")
+
+# Without logging configured, warnings and errors still reach stderr through
+# Python's last-resort handler; CAELUS_DEBUG=1 also turns on debug output
+# (port scan, chain layout)
+if os.environ.get("CAELUS_DEBUG"):
+    log.addHandler(logging.StreamHandler())
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+
+# MIDI note number -> frequency in Hz (A4 = 69 = 440Hz), precomputed for all 128 notes
+_MIDI_TO_HZ = tuple(440.0 * 2.0 ** ((n - 69) / 12.0) for n in range(128))
+
+# MIDI 7-bit value (velocity, pressure) 0-127 -> normalized 0-1 value
+_MIDI_NORM = tuple(v / 127.0 for v in range(128))
+
+# MIDI pressure (0-127) -> carrier gain curve 0.5 + p^2 * 2 (p normalized),
+# applied once per message instead of squaring a Sig at audio rate
+_AT_CURVE = tuple(0.5 + n * n * 2.0 for n in _MIDI_NORM)
+
+# Size of the shared wavetables: 1024 points (+1 guard point) keeps a table within
+# L1 cache, and linear interpolation at this size stays well below audible error
+_WAVETABLE_SIZE = 1024
+
+# Buffer size for preset file I/O, large enough to read or write a preset in
+# one system call
+_PRESET_IO_BUFFER = 1 << 16
+
+# Shortest allowed ramp duration in seconds (Linseg needs a positive segment time)
+_MIN_RAMP_TIME = 0.001
+
+# Slots in the MIDI event ring (power of two so indices wrap with a mask)
+_MIDI_RING_SIZE = 256
+_MIDI_RING_MASK = _MIDI_RING_SIZE - 1
+
+
+def _env_number(name, default, cast=float, minimum=0):
+    """
+    Read a numeric setting from the environment.
+    
+    Args:
+        name: Environment variable to read
+        default: Value used when the variable is unset or invalid
+        cast: Type to convert the value with (float or int)
+        minimum: Smallest accepted value
+        
+    Returns:
+        The parsed value, or default (with a warning) if it does not parse
+        or is not a finite number of at least minimum
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    # The negated comparison also rejects NaN
+    if value is None or not minimum <= value < float("inf"):
+        log.warning("ignoring invalid %s=%r, using %r", name, raw, default)
+        return default
+    return value
+
+
+# Extra delay in seconds before a MIDI message is applied (default 0). The
+# drain runs from a pyo Pattern, i.e. once per audio buffer, and applies every
+# event that is due, so an event waits at most one buffer; a positive value
+# only holds events back further and does not even out their timing
+_MIDI_LATENCY = _env_number("CAELUS_MIDI_LATENCY", 0.0)
+
+# Audio buffer size in samples for servers booted here. Smaller buffers lower
+# the output latency but raise the callback rate; raise it (512, 1024) on
+# slower machines if the audio drops out
+_SERVER_BUFFER_SIZE = _env_number("CAELUS_BUFFER_SIZE", 256, cast=int, minimum=1)
+
+
+def _preset_format(path):
+    """Return the preset format ('json', 'msgpack' or 'yaml') implied by path."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        return "json"
+    if ext == ".msgpack":
+        return "msgpack"
+    return "yaml"
+
+
+def _dump_preset(preset_data, f, path):
+    """
+    Serialize preset data to a binary file object.
+    
+    Args:
+        preset_data: Preset dictionary to write
+        f: File object opened in binary write mode
+        path: Preset file path; its extension selects the format
+    """
+    fmt = _preset_format(path)
+    if fmt == "json":
+        if orjson is not None:
+            f.write(orjson.dumps(preset_data, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(preset_data, indent=2).encode('utf-8'))
+    elif fmt == "msgpack":
+        if msgpack is None:
+            raise ImportError("msgpack is required for .msgpack presets")
+        msgpack.pack(preset_data, f, use_bin_type=True)
+    else:
+        yaml.dump(preset_data, f, Dumper=_YamlDumper, default_flow_style=False,
+                  sort_keys=False, encoding='utf-8')
+
+
+def _load_preset(f, path):
+    """
+    Deserialize preset data from a binary file object.
+    
+    Args:
+        f: File object opened in binary read mode
+        path: Preset file path; its extension selects the format
+        
+    Returns:
+        The preset dictionary
+    """
+    fmt = _preset_format(path)
+    if fmt == "json":
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+    if fmt == "msgpack":
+        if msgpack is None:
+            raise ImportError("msgpack is required for .msgpack presets")
+        return msgpack.unpack(f, raw=False)
+    return yaml.load(f, Loader=_YamlLoader)
+
+
+# Port found by _find_midi_port, keyed by preferred name. Only hits are
+# cached, so a device plugged in later is still picked up by the next scan
+_midi_ports = {}
+
+
+def _find_midi_port(prefer="Xkey"):
+    """
+    Find the MIDI input port to listen on.
+    
+    Port enumeration can block on the MIDI backend, so a found port is cached
+    and shared by every caller in the process.
+    
+    Args:
+        prefer: Substring of the preferred port name
+        
+    Returns:
+        The first port whose name contains prefer, else the first available
+        port, or None if there are no MIDI inputs or the backend fails
+    """
+    port = _midi_ports.get(prefer)
+    if port is not None:
+        return port
+    try:
+        # mido (and its MIDI backend) is only loaded once MIDI input is wanted
+        import mido
+        names = mido.get_input_names()
+    except Exception as e:
+        midi_log.error("could not list MIDI inputs: %s", e)
+        return None
+    for name in names:
+        midi_log.debug("midi port: %s", name)
+        if prefer in name:
+            port = name
+            break
+    else:
+        if not names:
+            return None
+        midi_log.warning("%s not found, using default port", prefer)
+        port = names[0]
+    _midi_ports[prefer] = port
+    return port
+
+
+class _MidiInput:
+    """
+    MIDI input shared by the mono and polyphonic dispatchers.
+    
+    Owns the port and the event ring between mido's callback thread and the
+    pyo server. Subclasses implement _note_on, _note_off and _polytouch, which
+    the drain calls on the server side with (note, value).
+    """
+    
+    def __init__(self, on_note, on_release, on_aftertouch):
+        """
+        Initialize the event ring.
+        
+        Args:
+            on_note: Called to sound a note
+            on_release: Called to release a note
+            on_aftertouch: Called with the curve-mapped pressure gain (0.5-2.5)
+        """
+        self._on_note = on_note
+        self._on_release = on_release
+        self._on_aftertouch = on_aftertouch
+        
+        # MIDI message type -> handler, so dispatch is a single dict lookup
+        self._handlers = {
+            'note_on': self._note_on,
+            'note_off': self._note_off,
+            'polytouch': self._polytouch,
+        }
+        
+        # Pre-allocated single-producer/single-consumer event ring: the MIDI
+        # callback only writes slots and advances head, the drain only reads
+        # and advances tail, so neither side needs a lock
+        self._ring = [(0.0, '', 0, 0)] * _MIDI_RING_SIZE
+        self._head = 0
+        self._tail = 0
+        
+        self._drain_pattern = None
+        self._port = None
+    
+    def open(self, port_name=None):
+        """
+        Open the MIDI input port and start draining events.
+        
+        mido's backend (RtMidi) calls feed from its own I/O thread as messages
+        arrive; feed only queues them, and a pyo Pattern drains the queue on
+        the server side where notes are triggered.
+        
+        Args:
+            port_name: Port to open, or None to look one up now
+        
+        Returns:
+            True if a port was opened, False if there are no MIDI inputs or
+            the port could not be opened (MIDI then stays disabled)
+        """
+        # Find a MIDI device (a found port is cached, so ports are scanned once)
+        if port_name is None:
+            port_name = _find_midi_port()
+        if port_name is None:
+            midi_log.warning("no MIDI input ports found")
+            return False
+        
+        # Keep a reference so the port (and its callback) stays open
+        try:
+            import mido
+            self._port = mido.open_input(port_name, callback=self.feed)
+        except Exception as e:
+            midi_log.error("could not open MIDI input %s: %s", port_name, e)
+            return False
+        
+        midi_log.info("listening on: %s", port_name)
+        
+        # Drain on the audio side so pyo objects are only touched by the server
+        self._drain_pattern = Pattern(self.drain, time=0.001).play()
+        return True
+    
+    def feed(self, msg, _clock=time.monotonic, _latency=_MIDI_LATENCY,
+             _mask=_MIDI_RING_MASK):
+        """
+        Queue a single incoming MIDI message for the audio-side drain.
+        
+        Runs on mido's backend thread, so it only copies the message fields
+        into the next ring slot; nothing here touches pyo objects.
+        
+        Args:
+            msg: The mido message to process
+            _clock, _latency, _mask: Bound at definition time so the callback
+                reads them as fast locals; not meant to be passed
+        """
+        # Stamp each event with the time it is due (arrival + _MIDI_LATENCY)
+        kind = msg.type
+        if kind == 'note_on' or kind == 'note_off':
+            event = (_clock() + _latency, kind, msg.note, msg.velocity)
+        elif kind == 'polytouch':
+            event = (_clock() + _latency, kind, msg.note, msg.value)
+        else:
+            return
+        
+        head = self._head
+        if head - self._tail > _mask:
+            # Ring full: drop rather than overwrite unread events
+            return
+        self._ring[head & _mask] = event
+        self._head = head + 1
+    
+    def drain(self, _clock=time.monotonic, _mask=_MIDI_RING_MASK):
+        """Dispatch every queued MIDI event whose scheduled time has come."""
+        ring = self._ring
+        handlers = self._handlers
+        tail = self._tail
+        now = _clock()
+        # Events share one latency offset, so they fall due in FIFO order and
+        # the first event that is not yet due ends the drain. Only handled
+        # message types are queued, so the handler lookup cannot miss
+        while tail != self._head:
+            due, kind, note, value = ring[tail & _mask]
+            if due > now:
+                break
+            # Consume the slot before handling it, so an event whose handler
+            # fails is dropped instead of being replayed on every drain
+            tail += 1
+            self._tail = tail
+            try:
+                handlers[kind](note, value)
+            except Exception:
+                midi_log.exception("error handling %s (note %d, value %d)", kind, note, value)
+
+
+class _MidiDispatcher(_MidiInput):
+    """
+    Monophonic MIDI state machine shared by Particle and CaelusSynth.
+    
+    Adds the held-note stack (last-note priority) and aftertouch filtering to
+    the event ring. The owner only supplies what sounding a note, releasing
+    and applying pressure actually do.
+    """
+    
+    def __init__(self, on_note, on_release, on_aftertouch, on_pitch=None):
+        """
+        Initialize the dispatcher.
+        
+        Args:
+            on_note: Called with (note, velocity), both 0-127, to sound a note
+            on_release: Called without arguments when the last held note is released
+            on_aftertouch: Called with the curve-mapped pressure gain (0.5-2.5) of
+                           the sounding note
+            on_pitch: Called with a note number to jump the sounding voice to a
+                      still-held note without restarting its envelopes (the pitch
+                      changes at once, without portamento); if None, the held note
+                      is replayed through on_note at velocity 100
+        """
+        super().__init__(on_note, on_release, on_aftertouch)
+        self._on_pitch = on_pitch
+        
+        # Held notes in press order (O(1) membership, removal and most-recent
+        # lookup); only touched by the drain on the audio side
+        self.active_notes = OrderedDict()
+        
+        # Note currently sounding (None while released)
+        self.sounding_note = None
+        
+        # Last raw polytouch value applied, so repeated pressure is skipped
+        self._last_poly = -1
+    
+    def _note_on(self, note, velocity):
+        """Push a pressed note onto the note stack and sound it."""
+        if velocity == 0:
+            # Note-on with zero velocity is a release
+            self._note_off(note, velocity)
+            return
+        
+        # (Re)insert the note so it becomes the most recent one
+        active = self.active_notes
+        active.pop(note, None)
+        active[note] = None
+        
+        self._on_note(note, velocity)
+        self.sounding_note = note
+    
+    def _note_off(self, note, velocity):
+        """Pop a released note and fall back to the most recent held note."""
+        active = self.active_notes
+        active.pop(note, None)
+        
+        # If we still have active notes, return to the most recent one, unless
+        # it is already sounding (an older held note was released)
+        last_note = next(reversed(active), None)
+        if last_note is not None:
+            if last_note != self.sounding_note:
+                if self._on_pitch is not None:
+                    # Legato: the pitch jumps to the held note while the
+                    # envelopes keep going
+                    self._on_pitch(last_note)
+                else:
+                    self._on_note(last_note, 100)  # Use default velocity of 100
+                self.sounding_note = last_note
+        else:
+            # No notes left, stop sound
+            self._on_release()
+            self.sounding_note = None
+    
+    def _polytouch(self, note, pressure):
+        """Apply aftertouch if it is for the currently playing note."""
+        # Only apply when the pressure actually changed
+        if note == next(reversed(self.active_notes), None) and pressure != self._last_poly:
+            self._last_poly = pressure
+            self._on_aftertouch(_AT_CURVE[pressure])
+
+
+class _PolyMidiDispatcher(_MidiInput):
+    """
+    Polyphonic counterpart of _MidiDispatcher: every held note sounds.
+    
+    Shares the event ring and drain, but has no last-note-priority stack.
+    Each event is forwarded with its note number so the owner can route it to
+    the voice holding that note: on_note(note, velocity), on_release(note)
+    and on_aftertouch(note, gain).
+    """
+    
+    def _note_on(self, note, velocity):
+        """Sound a pressed note on its own voice."""
+        if velocity == 0:
+            # Note-on with zero velocity is a release
+            self._on_release(note)
+            return
+        self._on_note(note, velocity)
+    
+    def _note_off(self, note, velocity):
+        """Release the voice holding the note."""
+        self._on_release(note)
+    
+    def _polytouch(self, note, pressure):
+        """Apply aftertouch to the voice holding the note."""
+        self._on_aftertouch(note, _AT_CURVE[pressure])
 
 
 class Oscillator:
@@ -30,6 +465,78 @@ class Oscillator:
     envelopes, and parameter ramping for both frequency and amplitude.
     """
     
+    # Fixed attribute set: no per-instance __dict__ and slot-based attribute access
+    __slots__ = (
+        'name', 'role',
+        'freq_ratio', 'freq_ratio_fine', 'mod_depth', 'mod_depth_fine', 'tuning_offset',
+        'table', 'freq_env', 'amp_env', 'freq_delay', 'depth_delay',
+        'freq_ramp_start', 'freq_ramp_end', 'freq_ramp_time', 'freq_ramp_time_fine', 'freq_ramp',
+        'amp_ramp_start', 'amp_ramp_end', 'amp_ramp_time', 'amp_ramp_time_fine', 'amp_ramp',
+        '_freq_ramp_key', '_amp_ramp_key',
+        'phase',
+        'feedback_amount', 'feedback_gain', 'feedback_frequency', 'feedback_signal',
+        'feedback_delay', '_feedback_on', '_pan_lfo_on',
+        'pre_feedback_freq',
+        'delay_dry_wet', 'delay_time', 'delay_feedback', 'delay_signal', 'panner',
+        'pan_lfo_active', 'pan_lfo_freq', 'pan_lfo_depth', 'pan_lfo_phase', 'pan_lfo_center',
+        'pan_lfo_wave', 'pan_lfo', 'pan_calc',
+        'osc', 'pre_osc', 'freq', 'amp', 'base_freq', 'output', 'signal',
+        '_param_sigs', 'ramp_sigs',
+    )
+    
+    # Preset layout of every parameter, in the order keys are written to preset
+    # files: (section, key, attribute, default). A section of None means the key
+    # lives at the top level of the preset dict. Entries with a default of None
+    # are not scalar Sigs (the envelopes and the delay tap list); they are loaded
+    # separately and only listed here to keep their position in saved presets.
+    PARAM_LAYOUT = (
+        (None, "ratio", "freq_ratio", 1.0),
+        (None, "ratio_fine", "freq_ratio_fine", 0.0),
+        (None, "index", "mod_depth", 1.0),
+        (None, "index_fine", "mod_depth_fine", 0.0),
+        (None, "freq_offset", "tuning_offset", 0.0),
+        (None, "phase", "phase", 0.0),
+        (None, "freq_env", "freq_env", None),
+        (None, "amp_env", "amp_env", None),
+        (None, "freq_delay", "freq_delay", 0.0),
+        (None, "depth_delay", "depth_delay", 0.0),
+        ("freq_ramp", "start", "freq_ramp_start", 0.0),
+        ("freq_ramp", "end", "freq_ramp_end", 0.0),
+        ("freq_ramp", "time", "freq_ramp_time", 1.0),
+        ("freq_ramp", "time_fine", "freq_ramp_time_fine", 0.0),
+        ("amp_ramp", "start", "amp_ramp_start", 1.0),
+        ("amp_ramp", "end", "amp_ramp_end", 1.0),
+        ("amp_ramp", "time", "amp_ramp_time", 1.0),
+        ("amp_ramp", "time_fine", "amp_ramp_time_fine", 0.0),
+        ("feedback", "amount", "feedback_amount", 0.0),
+        ("feedback", "gain", "feedback_gain", 0.5),
+        ("feedback", "frequency", "feedback_frequency", 0.0),
+        ("delay", "dry_wet", "delay_dry_wet", 0.3),
+        ("delay", "time", "delay_time", None),
+        ("delay", "feedback", "delay_feedback", 0.4),
+        ("pan_lfo", "active", "pan_lfo_active", 0.0),
+        ("pan_lfo", "center", "pan_lfo_center", 0.5),
+        ("pan_lfo", "freq", "pan_lfo_freq", 0.2),
+        ("pan_lfo", "depth", "pan_lfo_depth", 0.5),
+        ("pan_lfo", "phase", "pan_lfo_phase", 0.0),
+    )
+    
+    # Wavetables shared by every oscillator, keyed by their harmonic spec
+    _tables = {}
+    
+    @classmethod
+    def _shared_table(cls, harmonics=(1,)):
+        """
+        Return the shared HarmTable for the given harmonics, creating it on first use.
+        
+        Tables are read-only once built, so one instance can serve every oscillator
+        instead of each allocating an identical copy.
+        """
+        table = cls._tables.get(harmonics)
+        if table is None:
+            table = cls._tables[harmonics] = HarmTable(list(harmonics), size=_WAVETABLE_SIZE)
+        return table
+    
     def __init__(self, name, role="operator", ratio=1.0, index=1.0, freq_offset=0.0):
         """
         Initialize an oscillator with the specified parameters.
@@ -51,7 +558,7 @@ class Oscillator:
         self.tuning_offset = Sig(freq_offset)  # Fine tuning adjustment in Hz
         
         # Waveform
-        self.table = HarmTable([1])  # Default to sine wave
+        self.table = Oscillator._shared_table()  # Default to sine wave
         
         # ADSR envelopes
         self.freq_env = Adsr(attack=0.01, decay=0.1, sustain=0.5, release=0.3, dur=1, mul=50)
@@ -82,6 +589,11 @@ class Oscillator:
         self.amp_ramp = Linseg([(0, self.amp_ramp_start.value), 
                                (self.amp_ramp_time.value, self.amp_ramp_end.value)])
         
+        # Last (start, time, end) applied to each ramp, so unchanged ramps
+        # are not rebuilt (None until set_ramps first runs)
+        self._freq_ramp_key = None
+        self._amp_ramp_key = None
+        
         # Phase control
         self.phase = Sig(0.0)
         
@@ -90,12 +602,16 @@ class Oscillator:
         self.feedback_gain = Sig(0.5)        # Gain of feedback signal
         self.feedback_frequency = Sig(0.0)   # Frequency offset for feedback
         self.feedback_signal = None         # Will hold the feedback signal
+        self.feedback_delay = None          # Delay feeding the feedback path
+        self._feedback_on = None            # Gate states applied by update_gates
+        self._pan_lfo_on = None             # (None until first applied)
         
         # === Multi-tap delay parameters ===
         self.delay_dry_wet = Sig(0.3)        # Mix between dry and wet signals (0-1)
         self.delay_time = [Sig(0.125), Sig(0.25), Sig(0.375)]  # Delay times for each tap in seconds
         self.delay_feedback = Sig(0.4)       # Feedback amount for the delay
         self.delay_signal = None            # Will hold the delayed signal
+        self.panner = None                  # Pan placing the dry/wet blend
         
         # === NEW: LFO for panning parameters ===
         self.pan_lfo_active = Sig(0)        # 0 = off, 1 = on
@@ -104,13 +620,14 @@ class Oscillator:
         self.pan_lfo_phase = Sig(0.0)       # Default to 0 phase
         self.pan_lfo_center = Sig(0.5)      # Default to center pan position
         
-        # Create the LFO oscillator using HarmTable for efficiency
-        self.pan_lfo_wave = HarmTable([1])  # Default to sine wave
+        # Create the LFO oscillator reading the shared sine table
+        self.pan_lfo_wave = Oscillator._shared_table()  # Default to sine wave
         self.pan_lfo = Osc(table=self.pan_lfo_wave, freq=self.pan_lfo_freq, 
                           phase=self.pan_lfo_phase, mul=self.pan_lfo_depth)
         
-        # Calculate panning position: center + LFO (when active)
-        self.pan_calc = Clip(self.pan_lfo_center + (self.pan_lfo * self.pan_lfo_active), min=0, max=1)
+        # Calculate panning position: center + LFO (when active). No Clip node:
+        # Pan clamps its position to [0, 1] internally
+        self.pan_calc = self.pan_lfo_center + (self.pan_lfo * self.pan_lfo_active)
         
         # The oscillator itself - will be properly connected in the synth class
         self.osc = None
@@ -119,26 +636,63 @@ class Oscillator:
         self.amp = None
         self.base_freq = None
         self.output = None   # The final output signal after all processing
+        self.signal = None   # What downstream oscillators read (set by setup_delay)
+        
+        # Flat (section, key, object, default) view of PARAM_LAYOUT, bound once so
+        # preset save/load walk one tuple instead of resolving ~30 attributes
+        self._param_sigs = tuple(
+            (section, key, getattr(self, attr), default)
+            for section, key, attr, default in self.PARAM_LAYOUT
+        )
+        
+        # The eight Sigs that shape the ramps, in set_ramps argument order
+        self.ramp_sigs = (
+            self.freq_ramp_start, self.freq_ramp_end,
+            self.freq_ramp_time, self.freq_ramp_time_fine,
+            self.amp_ramp_start, self.amp_ramp_end,
+            self.amp_ramp_time, self.amp_ramp_time_fine,
+        )
         
     def update_ramps(self):
         """
         Update ramp segments based on combined macro and fine parameter values.
         """
-        # Calculate combined ramp times (ensure they never go below minimum)
-        freq_time = max(0.001, self.freq_ramp_time.get() + self.freq_ramp_time_fine.get())
-        amp_time = max(0.001, self.amp_ramp_time.get() + self.amp_ramp_time_fine.get())
+        self.set_ramps(*[sig.get() for sig in self.ramp_sigs])
+    
+    def set_ramps(self, freq_start, freq_end, freq_time, freq_time_fine,
+                  amp_start, amp_end, amp_time, amp_time_fine):
+        """
+        Update ramp segments from parameter values that were already read.
         
-        # Update frequency ramp
-        self.freq_ramp.setList([
-            (0, self.freq_ramp_start.get()),
-            (freq_time, self.freq_ramp_end.get())
-        ])
+        Each ramp remembers the segment it was last given, so a call that
+        changes nothing (e.g. the refresh on every note-on) skips setList.
+        
+        Args:
+            freq_start, freq_end: Frequency ramp start and end values
+            freq_time, freq_time_fine: Macro and fine frequency ramp times
+            amp_start, amp_end: Amplitude ramp start and end values
+            amp_time, amp_time_fine: Macro and fine amplitude ramp times
+        """
+        # Calculate combined ramp times (ensure they never go below minimum);
+        # an inline comparison avoids a max() builtin call per ramp
+        freq_time += freq_time_fine
+        if freq_time < _MIN_RAMP_TIME:
+            freq_time = _MIN_RAMP_TIME
+        amp_time += amp_time_fine
+        if amp_time < _MIN_RAMP_TIME:
+            amp_time = _MIN_RAMP_TIME
+        
+        # Update frequency ramp, skipping setList when the segment is unchanged
+        key = (freq_start, freq_time, freq_end)
+        if key != self._freq_ramp_key:
+            self._freq_ramp_key = key
+            self.freq_ramp.setList([(0, freq_start), (freq_time, freq_end)])
         
         # Update amplitude ramp
-        self.amp_ramp.setList([
-            (0, self.amp_ramp_start.get()),
-            (amp_time, self.amp_ramp_end.get())
-        ])
+        key = (amp_start, amp_time, amp_end)
+        if key != self._amp_ramp_key:
+            self._amp_ramp_key = key
+            self.amp_ramp.setList([(0, amp_start), (amp_time, amp_end)])
     
     def get_freq_ratio(self):
         """Get the combined frequency ratio from macro and fine controls"""
@@ -148,12 +702,24 @@ class Oscillator:
         """Get the combined modulation depth from macro and fine controls"""
         return self.mod_depth.get() + self.mod_depth_fine.get()
     
+    def make_base_freq(self, pitch):
+        """
+        Build the live base frequency: pitch * (ratio + fine ratio) + tuning offset.
+        
+        The ratio and tuning Sigs stay connected in the graph, so GUI changes
+        take effect immediately without rebuilding the chain.
+        
+        Args:
+            pitch: Signal carrying the note's fundamental frequency in Hz
+        """
+        return Sig(pitch, mul=self.freq_ratio + self.freq_ratio_fine, add=self.tuning_offset)
+    
     def setup_feedback(self):
         """Set up the feedback path for the oscillator"""
         if self.osc is not None and self.feedback_amount.get() > 0:
             # Create a delayed version of our own output signal
             # This avoids zero-delay feedback which can cause computation issues
-            delayed_feedback = Delay(self.osc, delay=0.001)
+            delayed_feedback = self.feedback_delay = Delay(self.osc, delay=0.001)
             
             # Scale the feedback signal by the feedback amount
             scaled_feedback = delayed_feedback * self.feedback_amount * self.feedback_gain
@@ -175,31 +741,85 @@ class Oscillator:
                 # Add feedback to frequency
                 self.freq = self.freq + self.feedback_signal
     
+    def update_gates(self):
+        """
+        Start or stop optional sub-graphs to match their on/off parameters.
+        
+        A stopped pyo object outputs zeros and is skipped by the server, so
+        the pan LFO only runs while it is active and the feedback path only
+        while its amount is above zero. The output is the same as multiplying
+        by the off switch, without processing the disabled branch. The delay
+        graph is built on demand the first time its wet level is raised.
+        """
+        pan_lfo_on = self.pan_lfo_active.get() > 0
+        if pan_lfo_on != self._pan_lfo_on:
+            self._pan_lfo_on = pan_lfo_on
+            if pan_lfo_on:
+                self.pan_lfo.play()
+            else:
+                self.pan_lfo.stop()
+        
+        # The feedback path only exists if it was enabled when the chain was built
+        if self.feedback_delay is not None:
+            feedback_on = self.feedback_amount.get() > 0
+            if feedback_on != self._feedback_on:
+                self._feedback_on = feedback_on
+                for node in (self.feedback_delay, self.feedback_signal):
+                    if feedback_on:
+                        node.play()
+                    else:
+                        node.stop()
+        
+        # The delay graph is built the first time the wet level is raised
+        if self.delay_signal is None and self.panner is not None and self.delay_dry_wet.get() > 0:
+            self.build_delay()
+    
     def setup_delay(self):
         """Set up the multi-tap delay effects for the oscillator with LFO panning"""
         if self.osc is not None:
-            # Create panner for the main oscillator with LFO control
-            self.direct_panner = Pan(self.osc, outs=2, pan=self.pan_calc)
-            
-            # Create a multi-tap delay with three taps for rich stereo spread
-            tap1 = Delay(self.osc, delay=self.delay_time[0], feedback=self.delay_feedback, mul=0.6)
-            tap2 = Delay(self.osc, delay=self.delay_time[1], feedback=self.delay_feedback * 0.8, mul=0.4)
-            tap3 = Delay(self.osc, delay=self.delay_time[2], feedback=self.delay_feedback * 0.6, mul=0.3)
-            
-            # Mix the three taps with offset pan positions based on the LFO position
-            # This creates a wider stereo image
-            tap1_pan = Pan(tap1, pan=Clip(self.pan_calc - 0.2, min=0, max=1))
-            tap2_pan = Pan(tap2, pan=self.pan_calc)
-            tap3_pan = Pan(tap3, pan=Clip(self.pan_calc + 0.2, min=0, max=1))
-            
-            # Mix the delayed signals
-            self.delay_signal = Mix([tap1_pan, tap2_pan, tap3_pan], voices=2)
-            
-            # Create a dry/wet balance between original and delayed signal
-            self.output = Interp(self.direct_panner, self.delay_signal, interp=self.delay_dry_wet)
+            # A single LFO-controlled panner places the oscillator; the delay
+            # graph is only built once the wet level is above zero (here, or
+            # later from update_gates), since a fully dry blend is the dry signal
+            self.panner = Pan(self.osc, outs=2, pan=self.pan_calc)
+            self.output = self.panner
+            if self.delay_dry_wet.get() > 0:
+                self.build_delay()
         else:
             # If no oscillator is created yet, just set output to None
             self.output = None
+        
+        # Signal that downstream oscillators read: the processed output, or the
+        # raw oscillator if there is none
+        self.signal = self.output if self.output is not None else self.osc
+    
+    def build_delay(self):
+        """
+        Build the multi-tap delay and feed the panner a dry/wet blend.
+        
+        Runs at most once per oscillator, the first time the wet level is
+        above zero; until then the panner reads the dry oscillator directly.
+        """
+        if self.delay_signal is None:
+            # Create a multi-tap delay as one multichannel Delay, a stream per
+            # tap; the staggered tap times spread the echoes in time. Delay and
+            # feedback are linear and the taps are summed below, so delaying the
+            # oscillator's channel sum gives the same result as delaying each
+            # channel separately
+            source = self.osc if len(self.osc) == 1 else Mix(self.osc, voices=1)
+            taps = Delay(
+                source,
+                delay=self.delay_time,
+                feedback=[self.delay_feedback, self.delay_feedback * 0.8, self.delay_feedback * 0.6],
+                mul=[0.6, 0.4, 0.3]
+            )
+            
+            # Mix the delayed signals in mono
+            self.delay_signal = Mix(taps, voices=1)
+            
+            # Dry/wet balance in mono, placed by the existing panner (panning is
+            # linear, so this equals panning dry and wet separately at the same
+            # position); setInput crossfades, so switching in is click-free
+            self.panner.setInput(Interp(self.osc, self.delay_signal, interp=self.delay_dry_wet))
     
     def play(self):
         """
@@ -228,8 +848,6 @@ class Oscillator:
         """
         Create GUI controls for all parameters of this oscillator with proper value ranges and scaling.
         """
-        from pyo import SLMap
-        
         # Frequency ratio - macro control (logarithmic scaling)
         freq_ratio_map = SLMap(0.1, 20.0, 'log', 'value', self.freq_ratio.get())
         self.freq_ratio.ctrl([freq_ratio_map], title=f"{self.name} Frequency Ratio")
@@ -348,70 +966,50 @@ class Oscillator:
         Returns:
             dict: All oscillator parameters formatted for YAML serialization
         """
-        params = {
-            "ratio": self.freq_ratio.get(),
-            "ratio_fine": self.freq_ratio_fine.get(),
-            "index": self.mod_depth.get(),
-            "index_fine": self.mod_depth_fine.get(),
-            "freq_offset": self.tuning_offset.get(),
-            "phase": self.phase.get(),
-            
-            "freq_env": {
-                "attack": self.freq_env.attack,
-                "decay": self.freq_env.decay,
-                "sustain": self.freq_env.sustain,
-                "release": self.freq_env.release,
-                "mul": self.freq_env.mul
-            },
-            "amp_env": {
-                "attack": self.amp_env.attack,
-                "decay": self.amp_env.decay,
-                "sustain": self.amp_env.sustain,
-                "release": self.amp_env.release,
-                "mul": self.amp_env.mul
-            },
-            
-            "freq_delay": self.freq_delay.get(),
-            "depth_delay": self.depth_delay.get(),
-            
-            "freq_ramp": {
-                "start": self.freq_ramp_start.get(),
-                "end": self.freq_ramp_end.get(),
-                "time": self.freq_ramp_time.get(),
-                "time_fine": self.freq_ramp_time_fine.get()
-            },
-            "amp_ramp": {
-                "start": self.amp_ramp_start.get(),
-                "end": self.amp_ramp_end.get(),
-                "time": self.amp_ramp_time.get(),
-                "time_fine": self.amp_ramp_time_fine.get()
-            },
-            
-            # Feedback parameters
-            "feedback": {
-                "amount": self.feedback_amount.get(),
-                "gain": self.feedback_gain.get(),
-                "frequency": self.feedback_frequency.get()
-            },
-            
-            # Delay parameters
-            "delay": {
-                "dry_wet": self.delay_dry_wet.get(),
-                "time": [self.delay_time[0].get(), self.delay_time[1].get(), self.delay_time[2].get()],
-                "feedback": self.delay_feedback.get()
-            },
+        # Walk the layout in order so keys keep their place in preset files
+        params = {}
+        for section, key, obj, default in self._param_sigs:
+            if default is not None:
+                value = obj.get()
+            elif key == "time":
+                # Delay tap times are stored as a list rather than individual keys
+                value = [sig.get() for sig in obj]
+            else:
+                # Envelope (Adsr) settings
+                value = {
+                    "attack": obj.attack,
+                    "decay": obj.decay,
+                    "sustain": obj.sustain,
+                    "release": obj.release,
+                    "mul": obj.mul
+                }
             
-            # NEW: Pan LFO parameters
-            "pan_lfo": {
-                "active": self.pan_lfo_active.get(),
-                "center": self.pan_lfo_center.get(),
-                "freq": self.pan_lfo_freq.get(),
-                "depth": self.pan_lfo_depth.get(),
-                "phase": self.pan_lfo_phase.get()
-            }
-        }
+            if section is None:
+                params[key] = value
+            else:
+                params.setdefault(section, {})[key] = value
         return params
         
+    @staticmethod
+    def _apply_adsr(env, params, mul):
+        """
+        Set an Adsr's segments and level from a preset section.
+        
+        Calls the setter methods directly rather than going through the
+        property descriptors; missing keys fall back to the shared defaults.
+        
+        Args:
+            env: The Adsr to update
+            params: Envelope section of the preset (may be empty)
+            mul: Default level if the section has no "mul" entry
+        """
+        get = params.get
+        env.setAttack(get("attack", 0.01))
+        env.setDecay(get("decay", 0.1))
+        env.setSustain(get("sustain", 0.5))
+        env.setRelease(get("release", 0.3))
+        env.setMul(get("mul", mul))
+    
     def load_parameters(self, params):
         """
         Load parameters from a dictionary (typically from a YAML preset file).
@@ -419,70 +1017,27 @@ class Oscillator:
         Args:
             params: Dictionary containing oscillator parameters
         """
-        # Basic parameters
-        self.freq_ratio.value = params.get("ratio", 1.0)
-        self.freq_ratio_fine.value = params.get("ratio_fine", 0.0)
-        self.mod_depth.value = params.get("index", 1.0)
-        self.mod_depth_fine.value = params.get("index_fine", 0.0)
-        self.tuning_offset.value = params.get("freq_offset", 0.0)
-        self.phase.value = params.get("phase", 0.0)
-        
-        # Envelope parameters
-        freq_env_params = params.get("freq_env", {})
-        self.freq_env.attack = freq_env_params.get("attack", 0.01)
-        self.freq_env.decay = freq_env_params.get("decay", 0.1)
-        self.freq_env.sustain = freq_env_params.get("sustain", 0.5)
-        self.freq_env.release = freq_env_params.get("release", 0.3)
-        self.freq_env.mul = freq_env_params.get("mul", 50)
-        
-        amp_env_params = params.get("amp_env", {})
-        self.amp_env.attack = amp_env_params.get("attack", 0.01)
-        self.amp_env.decay = amp_env_params.get("decay", 0.1)
-        self.amp_env.sustain = amp_env_params.get("sustain", 0.5)
-        self.amp_env.release = amp_env_params.get("release", 0.3)
-        self.amp_env.mul = amp_env_params.get("mul", 0.5 if self.role != "carrier" else 0.15)
-        
-        # Delay parameters
-        self.freq_delay.value = params.get("freq_delay", 0.0)
-        self.depth_delay.value = params.get("depth_delay", 0.0)
-        
-        # Ramp parameters
-        freq_ramp_params = params.get("freq_ramp", {})
-        self.freq_ramp_start.value = freq_ramp_params.get("start", 0.0)
-        self.freq_ramp_end.value = freq_ramp_params.get("end", 0.0)
-        self.freq_ramp_time.value = freq_ramp_params.get("time", 1.0)
-        self.freq_ramp_time_fine.value = freq_ramp_params.get("time_fine", 0.0)
-        
-        amp_ramp_params = params.get("amp_ramp", {})
-        self.amp_ramp_start.value = amp_ramp_params.get("start", 1.0)
-        self.amp_ramp_end.value = amp_ramp_params.get("end", 1.0)
-        self.amp_ramp_time.value = amp_ramp_params.get("time", 1.0)
-        self.amp_ramp_time_fine.value = amp_ramp_params.get("time_fine", 0.0)
-        
-        # Load feedback parameters
-        feedback_params = params.get("feedback", {})
-        self.feedback_amount.value = feedback_params.get("amount", 0.0)
-        self.feedback_gain.value = feedback_params.get("gain", 0.5)
-        self.feedback_frequency.value = feedback_params.get("frequency", 0.0)
-        
-        # Load delay parameters
-        delay_params = params.get("delay", {})
-        self.delay_dry_wet.value = delay_params.get("dry_wet", 0.3)
-        
-        delay_times = delay_params.get("time", [0.125, 0.25, 0.375])
-        for i, time in enumerate(delay_times[:3]):  # Ensure we only take up to 3 values
+        # Scalar parameters in a single pass over the layout; each section dict
+        # is looked up once and missing or empty sections fall back to defaults
+        sections = {None: params}
+        for section, key, sig, default in self._param_sigs:
+            if default is None:
+                continue  # Envelopes and tap times are applied below
+            source = sections.get(section)
+            if source is None:
+                source = sections[section] = params.get(section) or {}
+            sig.value = source.get(key, default)
+        
+        # Envelope parameters (an empty section in the file loads as None)
+        self._apply_adsr(self.freq_env, params.get("freq_env") or {}, 50)
+        self._apply_adsr(self.amp_env, params.get("amp_env") or {},
+                         0.5 if self.role != "carrier" else 0.15)
+        
+        # Delay tap times are a list rather than individual keys
+        tap_times = sections["delay"].get("time") or [0.125, 0.25, 0.375]
+        for i, tap_time in enumerate(tap_times[:3]):  # Ensure we only take up to 3 values
             if i < len(self.delay_time):
-                self.delay_time[i].value = time
-                
-        self.delay_feedback.value = delay_params.get("feedback", 0.4)
-        
-        # NEW: Load Pan LFO parameters
-        pan_lfo_params = params.get("pan_lfo", {})
-        self.pan_lfo_active.value = pan_lfo_params.get("active", 0.0)
-        self.pan_lfo_center.value = pan_lfo_params.get("center", 0.5)
-        self.pan_lfo_freq.value = pan_lfo_params.get("freq", 0.2)
-        self.pan_lfo_depth.value = pan_lfo_params.get("depth", 0.5)
-        self.pan_lfo_phase.value = pan_lfo_params.get("phase", 0.0)
+                self.delay_time[i].value = tap_time
         
         # Update the LFO oscillator with new parameters
         self.pan_lfo.freq = self.pan_lfo_freq
@@ -501,27 +1056,50 @@ class Particle:
     evolving timbres with dynamic stereo movement.
     """
     
-    def __init__(self, preset_file="caelus_preset.yaml", server=None):
+    def __init__(self, preset_file="caelus_preset.yaml", server=None, start_midi=None,
+                 controls=None, defaults=None, gui=True, autosave=True):
         """
         Initialize the FM synthesis engine.
         
         Args:
             preset_file: Path to the YAML preset file to load (if exists)
             server: Existing pyo server or None to create a new one
+            start_midi: Open a MIDI input for this particle. Defaults to True only
+                        when the particle boots its own server; a particle given
+                        a server is assumed to be driven by its owner
+            controls: Optional (pitch, velocity, aftertouch_curve) Sigs shared with other
+                      particles; a single write to one of them reaches every particle
+            defaults: Optional preset dictionary (e.g. DEFAULT_PRESET) applied when
+                      preset_file does not exist yet; the first save writes it out
+            gui: Build the parameter controls window for this particle
+            autosave: Save the preset to preset_file when the program exits
         """
-        # Store preset file path
+        # Store preset file path and the fallback preset
         self.preset_file = preset_file
+        self.preset_defaults = defaults
+        
+        # Only server-less particles scan for and open a MIDI input unless
+        # asked explicitly; a particle given a server is driven by its owner
+        start_midi = server is None if start_midi is None else start_midi
+        
+        # Resolve the MIDI port before any audio is running, so a slow or
+        # failing device scan happens up front
+        self.midi_port = _find_midi_port() if start_midi else None
         
         # Use provided server or boot a new one
         if server:
             self.s = server
         else:
-            self.s = Server(nchnls=2).boot()
+            self.s = Server(nchnls=2, buffersize=_SERVER_BUFFER_SIZE).boot()
             
         # === Control signals ===
-        self.pitch = Sig(440.0)  # Base frequency
-        self.velocity = Sig(0.0)  # MIDI velocity (0-1)
-        self.aftertouch = Sig(0.0)  # MIDI aftertouch (0-1)
+        if controls is not None:
+            # Driven by the owner of the shared controls
+            self.pitch, self.velocity, self.aftertouch_curve = controls
+        else:
+            self.pitch = Sig(440.0)  # Base frequency
+            self.velocity = Sig(0.0)  # MIDI velocity (0-1)
+            self.aftertouch_curve = Sig(_AT_CURVE[0])  # Aftertouch gain (0.5-2.5)
         
         # List to hold all operators (modulators)
         self.operators = []
@@ -563,23 +1141,40 @@ class Particle:
         self.setup_chain()
         
         # Set up GUI
-        self.setup_gui()
+        if gui:
+            self.setup_gui()
         
-        # Initialize active notes list for MIDI
-        self.active_notes = []
+        # MIDI note stack and event queue
+        self._midi = _MidiDispatcher(self.play_note, self.stop_note, self.set_aftertouch,
+                                     self.retrigger_pitch)
         
-        # Update ramps once to initialize
+        # Update ramps and sub-graph gates once to initialize
         self.update_all_ramps()
+        for update_gates in self._gate_fns:
+            update_gates()
+        
+        # Only now start polling for parameter changes; a server that is
+        # already running would otherwise run the poll mid-construction
+        self.param_poller.play()
+        
+        # Fingerprint of the parameters as they are on disk, so saving can be
+        # skipped when nothing changed (None forces the first save)
+        self._saved_hash = None
+        if os.path.exists(self.preset_file):
+            self._saved_hash = hash(repr(self._collect_preset_dict()))
         
         # Register save function to run on exit
-        import atexit
-        atexit.register(self.save_preset)
+        if autosave:
+            import atexit
+            atexit.register(self.save_preset)
         
         # If we created our own server, start it
         if not server:
             self.s.start()
-            # Launch MIDI handler
-            Thread(target=self.midi_loop, daemon=True).start()
+        
+        # Open MIDI input; messages are delivered on mido's backend thread
+        if start_midi:
+            self.start_midi()
     
     def initialize_operators(self, num_operators=4):
         """
@@ -617,30 +1212,72 @@ class Particle:
             
             # Add to operators list
             self.operators.append(op)
+        
+        # Preset key -> operator, built once and shared by preset save and load
+        self._op_map = {f"op{i+1}": op for i, op in enumerate(self.operators)}
     
     def setup_parameter_triggers(self):
         """
-        Set up triggers to update ramps when parameters change.
+        Set up a control-rate poll that updates ramps when parameters change.
         
-        This creates signal processing triggers that detect when parameters
-        are changed through the GUI, ensuring ramps are properly updated.
+        GUI edits arrive at human rates, so instead of summing every ramp
+        parameter at audio rate and watching the sum with a Change detector,
+        a ~30 Hz Pattern compares the ramp parameters against the last
+        snapshot and only updates the ramps when something moved. The same
+        poll gates the pan LFO and feedback sub-graphs on their switches.
         """
-        # Build a sum of all parameters that should trigger updates
-        trigger_sum = Sig(0)
+        # Every parameter that feeds a Linseg ramp, eight per oscillator in
+        # the argument order of Oscillator.set_ramps
+        self._ramp_oscs = tuple(self.operators) + (self.carrier,)
+        self._set_ramp_fns = tuple(osc.set_ramps for osc in self._ramp_oscs)
+        self._ramp_sigs = tuple(sig for osc in self._ramp_oscs for sig in osc.ramp_sigs)
+        self._ramp_snapshot = self._read_ramp_params()
+        
+        # Bound play methods of every ramp, fired back to back on note-on
+        self._ramp_plays = tuple(
+            play
+            for osc in (self.carrier,) + tuple(self.operators)
+            for play in (osc.freq_ramp.play, osc.amp_ramp.play)
+        )
         
-        # Add operator parameters
-        for op in self.operators:
-            trigger_sum = trigger_sum + op.freq_ramp_start + op.freq_ramp_end + op.freq_ramp_time + \
-                         op.amp_ramp_start + op.amp_ramp_end + op.amp_ramp_time
+        # Envelopes gated by notes: the carrier amplitude envelope plus both
+        # envelopes of every operator
+        envs = (self.carrier.amp_env,) + tuple(
+            env for op in self.operators for env in (op.freq_env, op.amp_env)
+        )
+        self._env_plays = tuple(env.play for env in envs)
+        self._env_stops = tuple(env.stop for env in envs)
         
-        # Add carrier parameters
-        trigger_sum = trigger_sum + self.carrier.freq_ramp_start + self.carrier.freq_ramp_end + \
-                     self.carrier.freq_ramp_time + self.carrier.amp_ramp_start + \
-                     self.carrier.amp_ramp_end + self.carrier.amp_ramp_time
+        # On/off switches of the optional sub-graphs (pan LFO, feedback) are
+        # checked on the same poll
+        self._gate_fns = tuple(osc.update_gates for osc in self._ramp_oscs)
         
-        # Create the trigger
-        param_trigger = Change(trigger_sum).play()
-        self.param_updater = TrigFunc(param_trigger, self.update_all_ramps)
+        # Poll at roughly GUI frame rate; the audio thread does no detection work.
+        # Not started here: the poll touches the chain, which is built later
+        # (Particle.__init__ plays it once everything is in place)
+        self.param_poller = Pattern(self._poll_params, time=0.033)
+    
+    def _read_ramp_params(self):
+        """Return the current values of all ramp parameters as a tuple."""
+        return tuple(sig.get() for sig in self._ramp_sigs)
+    
+    def _poll_params(self):
+        """Update the ramps of oscillators whose ramp parameters changed since
+        the last poll, and start or stop the optional sub-graphs to match
+        their switches."""
+        snapshot = self._read_ramp_params()
+        previous = self._ramp_snapshot
+        if snapshot != previous:
+            self._ramp_snapshot = snapshot
+            # Only the oscillators whose eight-value slice moved are updated,
+            # so one knob edit touches one oscillator
+            for i, set_ramps in enumerate(self._set_ramp_fns):
+                values = snapshot[i * 8:i * 8 + 8]
+                if values != previous[i * 8:i * 8 + 8]:
+                    set_ramps(*values)
+        
+        for update_gates in self._gate_fns:
+            update_gates()
     
     def on_server_close(self):
         """
@@ -651,75 +1288,123 @@ class Particle:
         # Use a flag to prevent multiple calls
         if not hasattr(self, '_closing'):
             self._closing = True
-            print("Saving preset...")
+            log.info("Saving preset...")
             self.save_preset()
         
-    def save_preset(self):
+    def _collect_preset_dict(self):
         """
-        Save all parameters to a preset file.
+        Gather all operator and carrier parameters into a preset dictionary.
         
-        Creates a YAML file containing all operator and carrier parameters.
+        Returns:
+            Dictionary in the preset file layout
         """
-        preset_data = {"particle1": {}}
-        
         # Save operator parameters
-        for i, op in enumerate(self.operators):
-            preset_data["particle1"][f"op{i+1}"] = op.get_parameters()
+        particle_data = {name: op.get_parameters() for name, op in self._op_map.items()}
         
         # Save carrier parameters
-        preset_data["particle1"]["carrier"] = self.carrier.get_parameters()
+        particle_data["carrier"] = self.carrier.get_parameters()
+        
+        return {"particle1": particle_data}
+    
+    def save_preset(self):
+        """
+        Save all parameters to a preset file.
         
+        Writes all operator and carrier parameters as YAML, or as JSON/msgpack
+        when the preset file ends in .json/.msgpack. Nothing is written if the
+        parameters match what was last loaded or saved. The file is written
+        next to the preset and renamed over it, so an interrupted save never
+        leaves a truncated preset behind.
+        """
+        preset_data = self._collect_preset_dict()
+        
+        # Skip the dump entirely when no parameter changed
+        preset_hash = hash(repr(preset_data))
+        if preset_hash == self._saved_hash:
+            return
+        
+        tmp_file = self.preset_file + ".tmp"
         try:
-            with open(self.preset_file, 'w') as f:
-                yaml.dump(preset_data, f, default_flow_style=False, sort_keys=False)
-            print(f"Preset saved to {self.preset_file}")
+            # Binary, large-buffered handle: every backend writes bytes directly
+            with open(tmp_file, 'wb', buffering=_PRESET_IO_BUFFER) as f:
+                _dump_preset(preset_data, f, self.preset_file)
+            
+            # Atomic on POSIX and Windows: readers see the old or the new preset
+            os.replace(tmp_file, self.preset_file)
+            self._saved_hash = preset_hash
+            log.info("Preset saved to %s", self.preset_file)
         except Exception as e:
-            print(f"Error saving preset: {e}")
+            log.error("Error saving preset: %s", e)
+            # Don't leave a partial temporary file next to the preset
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
     
     def load_preset(self):
         """
         Load parameters from a preset file if it exists.
         
-        Looks for the specified preset file and loads its parameters.
+        Looks for the specified preset file and loads its parameters. The
+        file format (YAML, JSON or msgpack) follows the file extension. If
+        the file does not exist, the in-memory default preset (if any) is
+        applied directly, without serializing or parsing it.
         """
         if not os.path.exists(self.preset_file):
-            print(f"No preset file found at {self.preset_file}, using defaults")
+            if self.preset_defaults is not None:
+                self.apply_preset(self.preset_defaults)
+                log.info("No preset file found at %s, using the built-in preset",
+                         self.preset_file)
+            else:
+                log.info("No preset file found at %s, using defaults", self.preset_file)
             return
         
         try:
-            with open(self.preset_file, 'r') as f:
-                preset_data = yaml.safe_load(f)
+            # The loaders decode the bytes themselves, so skip text-mode decoding
+            with open(self.preset_file, 'rb', buffering=_PRESET_IO_BUFFER) as f:
+                preset_data = _load_preset(f, self.preset_file)
             
-            # Load from the structure
-            if "particle1" in preset_data:
-                particle_data = preset_data["particle1"]
-                
-                # Load operator parameters
-                for i, op in enumerate(self.operators):
-                    key = f"op{i+1}"
-                    if key in particle_data:
-                        op.load_parameters(particle_data[key])
-                        print(f"Loaded {key} parameters")
-                
-                # Load carrier parameters
-                if "carrier" in particle_data:
-                    self.carrier.load_parameters(particle_data["carrier"])
-                    print("Loaded Carrier parameters")
-            
-            print(f"Preset loaded from {self.preset_file}")
+            self.apply_preset(preset_data)
+            log.info("Preset loaded from %s", self.preset_file)
         except Exception as e:
-            print(f"Error loading preset: {e}")
+            log.error("Error loading preset: %s", e)
+    
+    def apply_preset(self, preset_data):
+        """
+        Apply a preset dictionary to the operators and carrier.
+        
+        Args:
+            preset_data: Preset structure as produced by _collect_preset_dict
+        """
+        # Load from the structure; each section is fetched with a single lookup
+        # and missing or empty sections are skipped
+        particle_data = preset_data.get("particle1")
+        if not particle_data:
+            return
+        
+        # Load operator parameters
+        for name, op in self._op_map.items():
+            op_data = particle_data.get(name)
+            if op_data:
+                op.load_parameters(op_data)
+                log.debug("Loaded %s parameters", name)
+        
+        # Load carrier parameters
+        carrier_data = particle_data.get("carrier")
+        if carrier_data:
+            self.carrier.load_parameters(carrier_data)
+            log.debug("Loaded Carrier parameters")
     
     def update_all_ramps(self):
         """
         Update all operator and carrier ramps.
         
-        Calls the update_ramps method on each oscillator to ensure
-        all parameter changes are reflected in the audio processing.
+        Reads every ramp parameter in one pass and hands each oscillator its
+        slice, so all parameter changes are reflected in the audio processing.
         """
-        for op in self.operators:
-            op.update_ramps()
-        self.carrier.update_ramps()
+        values = self._read_ramp_params()
+        
+        # The oscillator set is fixed, so the bound set_ramps methods are cached
+        for i, set_ramps in enumerate(self._set_ramp_fns):
+            set_ramps(*values[i * 8:i * 8 + 8])
         
     def setup_chain(self):
         """
@@ -737,83 +1422,68 @@ class Particle:
         
         # Add GUI control for MOD_GAIN with a range from 0.1 to 5.0 using SLMap
         # This gives tremendous range from subtle to extreme FM
-        from pyo import SLMap
         mod_gain_map = SLMap(0.1, 5.0, 'lin', 'value', 1.0)
         self.mod_gain.ctrl([mod_gain_map], title="FM Modulation Intensity")
         
+        # Signals referenced by every stage of the chain, bound once
+        pitch = self.pitch
+        mod_gain = self.mod_gain
+        
         # Make sure we have operators
         if not self.operators:
             # No operators, carrier is unmodulated
-            self.carrier.base_freq = self.pitch
-            self.carrier.freq = self.carrier.base_freq + (self.carrier.freq_ramp * self.pitch)
-            
-            # Create carrier oscillator
-            self.carrier.osc = Sine(
-                freq=self.carrier.freq,
-                mul=self.carrier.amp_env * self.velocity * (0.5 + self.aftertouch**2 * 2) * self.carrier.amp_ramp
-            )
-            
-            # Apply feedback if enabled
-            self.carrier.setup_feedback()
-            
-            # Apply delay and panning (with LFO)
-            self.carrier.setup_delay()
-            
-            # Set output - either direct oscillator or delayed version
-            if self.carrier.output is None:
-                # Create panner for the oscillator with LFO control if no delay is used
-                self.carrier.output = Pan(self.carrier.osc, outs=2, pan=self.carrier.pan_calc)
+            self.carrier.base_freq = pitch
+            self.carrier.freq = self.carrier.base_freq + (self.carrier.freq_ramp * pitch)
         else:
             # We'll implement a serial chain with user-controllable modulation strength
             
             # Start with the first operator (unmodulated except for self-feedback)
-            # Use the combined frequency ratio (macro + fine)
-            combined_ratio = self.operators[0].get_freq_ratio()
-            combined_depth = self.operators[0].get_mod_depth()
+            first_op = self.operators[0]
+            combined_depth = first_op.get_mod_depth()
             
-            self.operators[0].base_freq = self.pitch * combined_ratio + self.operators[0].tuning_offset.get()
-            self.operators[0].freq = self.operators[0].base_freq + (self.operators[0].freq_ramp * self.pitch)
+            # Live base frequency from the combined ratio (macro + fine) and tuning offset
+            first_op.base_freq = first_op.make_base_freq(pitch)
+            first_op.freq = first_op.base_freq + (first_op.freq_ramp * pitch)
             
             # Scale modulation depth by base frequency, with GUI control
-            self.operators[0].amp = self.operators[0].base_freq * combined_depth * \
-                                self.operators[0].amp_env * self.operators[0].amp_ramp * self.mod_gain
+            first_op.amp = first_op.base_freq * combined_depth * \
+                           first_op.amp_env * first_op.amp_ramp * mod_gain
             
             # Create the oscillator
-            self.operators[0].osc = Sine(
-                freq=self.operators[0].freq, 
-                phase=self.operators[0].phase, 
-                mul=self.operators[0].amp
+            first_op.osc = Sine(
+                freq=first_op.freq, 
+                phase=first_op.phase, 
+                mul=first_op.amp
             )
             
             # Add feedback loop to first operator
-            self.operators[0].setup_feedback()
+            first_op.setup_feedback()
             
             # Add delay and panning with LFO to first operator
-            self.operators[0].setup_delay()
+            first_op.setup_delay()
             
             # Now set up the rest of the operators, each modulated by the previous one
             for i in range(1, len(self.operators)):
                 prev_op = self.operators[i-1]
                 curr_op = self.operators[i]
                 
-                # Get combined ratio and depth for this operator
-                combined_ratio = curr_op.get_freq_ratio()
+                # Get combined depth for this operator
                 combined_depth = curr_op.get_mod_depth()
                 
                 # Calculate base frequency (without modulation)
-                curr_op.base_freq = self.pitch * combined_ratio + curr_op.tuning_offset.get()
+                curr_op.base_freq = curr_op.make_base_freq(pitch)
                 
                 # Apply modulation with GUI-controllable strength
                 # Use output from previous operator which includes any delay and feedback
-                mod_signal = (prev_op.output if prev_op.output is not None else prev_op.osc) * \
-                             (1.0 + combined_depth) * self.mod_gain
+                mod_signal = prev_op.signal * (1.0 + combined_depth) * mod_gain
                 
                 # Apply frequency modulation from previous operator
-                curr_op.freq = curr_op.base_freq + (curr_op.freq_ramp * self.pitch) + mod_signal
+                curr_op.freq = curr_op.base_freq + (curr_op.freq_ramp * pitch) + mod_signal
                 
                 # Scale modulation depth by base frequency with GUI-controllable strength
-                curr_op.amp = curr_op.base_freq * combined_depth * 1.5 * \
-                            curr_op.amp_env * curr_op.amp_ramp * self.mod_gain
+                # (constant factors are multiplied in Python so pyo sees a single scalar)
+                curr_op.amp = curr_op.base_freq * (combined_depth * 1.5) * \
+                            curr_op.amp_env * curr_op.amp_ramp * mod_gain
                 
                 # Create oscillator
                 curr_op.osc = Sine(freq=curr_op.freq, phase=curr_op.phase, mul=curr_op.amp)
@@ -824,28 +1494,31 @@ class Particle:
                 # Add delay and panning with LFO to this operator
                 curr_op.setup_delay()
                 
-                # Debug output
-                print(f"{curr_op.name}: Base freq = {curr_op.base_freq.get()}, Modulated by {prev_op.name}")
+                # Debug output (guarded so the .get() readback only happens when enabled)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("%s: Base freq = %s, Modulated by %s",
+                              curr_op.name, curr_op.base_freq.get(), prev_op.name)
             
             # Carrier is modulated by the last operator with GUI-controllable strength
             last_op = self.operators[-1]
-            combined_ratio = self.carrier.get_freq_ratio()
             
-            self.carrier.base_freq = self.pitch * combined_ratio + self.carrier.tuning_offset.get()
+            self.carrier.base_freq = self.carrier.make_base_freq(pitch)
             
             # Apply modulation to carrier, with extra emphasis but still GUI-controllable 
             # Use output from last operator which includes any delay and feedback
-            mod_signal = (last_op.output if last_op.output is not None else last_op.osc) * self.mod_gain * 2.0
-            self.carrier.freq = self.carrier.base_freq + (self.carrier.freq_ramp * self.pitch) + mod_signal
+            mod_signal = last_op.signal * mod_gain * 2.0
+            self.carrier.freq = self.carrier.base_freq + (self.carrier.freq_ramp * pitch) + mod_signal
             
-            # Debug output
-            print(f"Carrier: Base freq = {self.carrier.base_freq.get()}, Modulated by {last_op.name}")
+            # Debug output (guarded so the .get() readback only happens when enabled)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Carrier: Base freq = %s, Modulated by %s",
+                          self.carrier.base_freq.get(), last_op.name)
         
-        # Carrier oscillator with amplitude controls
+        # Carrier oscillator with amplitude controls, built once for both branches
         self.carrier.osc = Sine(
             freq=self.carrier.freq,
             phase=self.carrier.phase,
-            mul=self.carrier.amp_env * self.velocity * (0.5 + self.aftertouch**2 * 2) * self.carrier.amp_ramp
+            mul=self.carrier.amp_env * self.velocity * self.aftertouch_curve * self.carrier.amp_ramp
         )
         
         # Apply feedback to carrier
@@ -855,10 +1528,9 @@ class Particle:
         self.carrier.setup_delay()
         
         # === STEREO OUTPUT WITH LFO PANNING ===
-        # Use the carrier's processed output if available, otherwise use the raw oscillator with direct panning
+        # The carrier's panner (set up by setup_delay above, since its oscillator
+        # now exists) is the stereo output
         carrier_signal = self.carrier.output
-        if carrier_signal is None:
-            carrier_signal = Pan(self.carrier.osc, outs=2, pan=self.carrier.pan_calc)
         
         # === AUDIO OUTPUT WITH LIMITER ===
         # Dynamic limiting to handle modulation extremes
@@ -885,92 +1557,56 @@ class Particle:
             note: MIDI note number (0-127)
             velocity_val: MIDI velocity (0-127)
         """
-        # Convert MIDI note to frequency (A4 = 69 = 440Hz)
-        freq_val = 440.0 * (2 ** ((note - 69) / 12))
-        self.pitch.value = freq_val
-        self.velocity.value = velocity_val / 127
+        # Convert MIDI note and velocity with the precomputed lookup tables
+        self.pitch.value = _MIDI_TO_HZ[note]
+        self.velocity.value = _MIDI_NORM[velocity_val]
         
-        # Play carrier envelope
-        self.carrier.amp_env.play()
-        
-        # Play all operator envelopes
-        for op in self.operators:
-            op.freq_env.play()
-            op.amp_env.play()
+        self.trigger()
+    
+    def retrigger_pitch(self, note):
+        """
+        Jump the sounding note to a new pitch without restarting envelopes or ramps.
         
-        # Force an update of the ramps
-        self.update_all_ramps()
+        The pitch changes immediately; there is no portamento.
         
-        # Play carrier ramps
-        self.carrier.freq_ramp.play()
-        self.carrier.amp_ramp.play()
+        Args:
+            note: MIDI note number (0-127)
+        """
+        self.pitch.value = _MIDI_TO_HZ[note]
+    
+    def trigger(self):
+        """
+        Start the envelopes and ramps at the current pitch and velocity.
         
-        # Play all operator ramps
-        for op in self.operators:
-            op.freq_ramp.play()
-            op.amp_ramp.play()
+        Used directly when the pitch and velocity Sigs are shared and have
+        already been set by their owner.
+        """
+        # Play carrier and operator envelopes
+        for play in self._env_plays:
+            play()
+        
+        # Restart carrier and operator ramps from the prebuilt method tuple; their
+        # segments are kept current by the parameter poll, not rebuilt per note
+        for play in self._ramp_plays:
+            play()
     
     def stop_note(self):
         """
         Stop the current note by releasing all envelopes.
         """
-        # Stop carrier envelope
-        self.carrier.amp_env.stop()
-        
-        # Stop all operator envelopes
-        for op in self.operators:
-            op.freq_env.stop()
-            op.amp_env.stop()
+        # Release carrier and operator envelopes
+        for stop in self._env_stops:
+            stop()
+    
+    def set_aftertouch(self, value):
+        """Set the curve-mapped aftertouch gain (see _AT_CURVE)."""
+        self.aftertouch_curve.value = value
     
-    def midi_loop(self):
+    def start_midi(self):
         """
-        Handle MIDI input in a separate thread.
-        
-        This method runs in a separate thread and processes incoming MIDI messages,
-        triggering notes and handling polyphony by tracking active notes.
+        Open the MIDI input port; notes are applied on the server side.
         """
-        # Try to find a MIDI device
-        port_name = None
-        for name in mido.get_input_names():
-            print("→", name)
-            if "Xkey" in name:
-                port_name = name
-                break
-        if not port_name:
-            print("❌ Xkey not found. Using default.")
-            port_name = mido.get_input_names()[0]
-        
-        print(f"🎹 Listening on: {port_name}")
-        
-        # Open the MIDI port and process messages
-        with mido.open_input(port_name) as port:
-            for msg in port:
-                if msg.type == 'note_on' and msg.velocity > 0:
-                    # Add the new note to our active notes list
-                    if msg.note not in self.active_notes:
-                        self.active_notes.append(msg.note)
-                    
-                    # Play the most recently pressed note (last in the list)
-                    self.play_note(self.active_notes[-1], msg.velocity)
-                    
-                elif msg.type in ['note_off', 'note_on'] and msg.velocity == 0:
-                    # Remove the note from active notes
-                    if msg.note in self.active_notes:
-                        self.active_notes.remove(msg.note)
-                    
-                    # If we still have active notes, play the most recent one
-                    if self.active_notes:
-                        # Get the last pressed note still active
-                        last_note = self.active_notes[-1]
-                        self.play_note(last_note, 100)  # Use default velocity of 100
-                    else:
-                        # No notes left, stop sound
-                        self.stop_note()
-                        
-                elif msg.type == 'polytouch':
-                    # Apply aftertouch only if it's for the currently playing note
-                    if self.active_notes and msg.note == self.active_notes[-1]:
-                        self.aftertouch.value = msg.value / 127
+        self._midi.open(self.midi_port)
     
     def setup_gui(self):
         """
@@ -990,88 +1626,181 @@ class CaelusSynth:
     
     This class acts as a container for multiple Particle instances, allowing for
     more complex sound design through layering of multiple FM synthesis voices.
+    In polyphonic mode the particles are a voice pool instead: each note gets
+    a particle of its own, and every voice plays the same preset.
     """
     
-    def __init__(self, num_particles=1, preset_dir="presets"):
+    def __init__(self, num_particles=1, preset_dir="presets", preset_ext=".yaml",
+                 polyphonic=False, voices=8):
         """
         Initialize the Caelus FM synthesis engine.
         
         Args:
-            num_particles: Number of FM synthesis particles to create
+            num_particles: Number of FM synthesis particles to layer (ignored in
+                           polyphonic mode)
             preset_dir: Directory for preset files
+            preset_ext: Preset file extension, which selects the format
+                        (".yaml", ".json" or ".msgpack")
+            polyphonic: Use the particles as a pool of voices, one per held note
+                        (the oldest note is stolen when all are busy), instead of
+                        layering all of them on the most recent note
+            voices: Size of the voice pool in polyphonic mode (at least 2)
         """
+        if polyphonic and voices < 2:
+            raise ValueError(f"polyphonic mode needs at least 2 voices, got {voices}")
+        
+        # Resolve the MIDI port before any audio is running
+        self.midi_port = _find_midi_port()
+        
         # Boot the audio server
-        self.s = Server(nchnls=2).boot()
+        self.s = Server(nchnls=2, buffersize=_SERVER_BUFFER_SIZE).boot()
         self.s.start()
         
         # Create preset directory if it doesn't exist
-        if not os.path.exists(preset_dir):
-            os.makedirs(preset_dir)
+        os.makedirs(preset_dir, exist_ok=True)
+        
+        if polyphonic:
+            # Every voice plays its own note, so each particle keeps its own controls
+            controls = None
+        else:
+            # Control signals shared by every particle, so each MIDI value is
+            # written once rather than once per particle
+            self.pitch = Sig(440.0)
+            self.velocity = Sig(0.0)
+            self.aftertouch_curve = Sig(_AT_CURVE[0])
+            controls = (self.pitch, self.velocity, self.aftertouch_curve)
         
         # List to store particles
         self.particles = []
         
-        # Create particles
-        for i in range(num_particles):
-            preset_file = os.path.join(preset_dir, f"particle{i+1}.yaml")
-            particle = Particle(preset_file=preset_file, server=self.s)
-            self.particles.append(particle)
-        
-        # Track active notes across all particles
-        self.active_notes = []
+        # Create particles; the synth owns the single MIDI input and fans notes
+        # out itself
+        if polyphonic:
+            # Every voice loads the first particle's preset; only the first
+            # voice gets a GUI and saves, and the others follow its edits
+            preset_file = os.path.join(preset_dir, f"particle1{preset_ext}")
+            for i in range(voices):
+                particle = Particle(preset_file=preset_file, server=self.s, start_midi=False,
+                                    gui=i == 0, autosave=i == 0)
+                self.particles.append(particle)
+        else:
+            for i in range(num_particles):
+                preset_file = os.path.join(preset_dir, f"particle{i+1}{preset_ext}")
+                particle = Particle(preset_file=preset_file, server=self.s, start_midi=False,
+                                    controls=controls)
+                self.particles.append(particle)
+        
+        if polyphonic:
+            # Copy GUI edits on the first voice to the others a few times a
+            # second; the preset is only applied when its fingerprint changed
+            self._lead_hash = hash(repr(self.particles[0]._collect_preset_dict()))
+            self._voice_sync = Pattern(self._sync_voices, time=0.25).play()
+            
+            # Idle voices, least recently released first, and the voice holding
+            # each sounding note in the order the notes were played
+            self._free_voices = deque(self.particles)
+            self._note_voices = OrderedDict()
+            
+            # Event queue routing each note to its own voice
+            self._midi = _PolyMidiDispatcher(self._play_voice, self._release_voice,
+                                             self._voice_aftertouch)
+        else:
+            # Bind the fan-out once; a single particle (the common case) is
+            # triggered directly without looping
+            if len(self.particles) == 1:
+                self._trigger_all = self.particles[0].trigger
+                self._stop_all = self.particles[0].stop_note
+            else:
+                self._trigger_all = self._trigger_particles
+                self._stop_all = self._stop_particles
+            
+            # MIDI note stack and event queue shared by all particles
+            self._midi = _MidiDispatcher(self._play_shared, self._stop_all, self._set_aftertouch,
+                                         self._retrigger_shared)
         
         # Start MIDI handler
-        Thread(target=self.midi_loop, daemon=True).start()
+        self.start_midi()
     
-    def midi_loop(self):
+    def start_midi(self):
         """
-        Handle MIDI input and distribute to all particles.
+        Open the MIDI input port; notes are distributed to all particles.
         """
-        # Try to find a MIDI device
-        port_name = None
-        for name in mido.get_input_names():
-            print("→", name)
-            if "Xkey" in name:
-                port_name = name
-                break
-        if not port_name:
-            print("❌ Xkey not found. Using default.")
-            port_name = mido.get_input_names()[0]
-        
-        print(f"🎹 Listening on: {port_name}")
-        
-        # Open the MIDI port and process messages
-        with mido.open_input(port_name) as port:
-            for msg in port:
-                if msg.type == 'note_on' and msg.velocity > 0:
-                    # Add the new note to active notes list
-                    if msg.note not in self.active_notes:
-                        self.active_notes.append(msg.note)
-                    
-                    # Play the note on all particles
-                    for particle in self.particles:
-                        particle.play_note(msg.note, msg.velocity)
-                    
-                elif msg.type in ['note_off', 'note_on'] and msg.velocity == 0:
-                    # Remove the note from active notes
-                    if msg.note in self.active_notes:
-                        self.active_notes.remove(msg.note)
-                    
-                    # If we still have active notes, play the most recent one on all particles
-                    if self.active_notes:
-                        last_note = self.active_notes[-1]
-                        for particle in self.particles:
-                            particle.play_note(last_note, 100)  # Default velocity
-                    else:
-                        # No notes left, stop sound on all particles
-                        for particle in self.particles:
-                            particle.stop_note()
-                            
-                elif msg.type == 'polytouch':
-                    # Apply aftertouch to all particles if it's for the currently playing note
-                    if self.active_notes and msg.note == self.active_notes[-1]:
-                        for particle in self.particles:
-                            particle.aftertouch.value = msg.value / 127
+        self._midi.open(self.midi_port)
+    
+    def _play_shared(self, note, velocity):
+        """
+        Play a note on all particles.
+        
+        Args:
+            note: MIDI note number (0-127)
+            velocity: MIDI velocity (0-127)
+        """
+        # Set the shared pitch and velocity once, then trigger every particle
+        self.pitch.value = _MIDI_TO_HZ[note]
+        self.velocity.value = _MIDI_NORM[velocity]
+        self._trigger_all()
+    
+    def _retrigger_shared(self, note):
+        """Jump every particle to a held note's pitch through the shared pitch Sig
+        (immediately, without portamento)."""
+        self.pitch.value = _MIDI_TO_HZ[note]
+    
+    def _set_aftertouch(self, value):
+        """Set the shared curve-mapped aftertouch gain (see _AT_CURVE)."""
+        self.aftertouch_curve.value = value
+    
+    def _trigger_particles(self):
+        """Trigger every particle at the shared pitch and velocity."""
+        for particle in self.particles:
+            particle.trigger()
+    
+    def _stop_particles(self):
+        """Release every particle."""
+        for particle in self.particles:
+            particle.stop_note()
+    
+    def _play_voice(self, note, velocity):
+        """
+        Play a note on a voice of its own (polyphonic mode).
+        
+        A repeated note reuses its voice; otherwise the least recently released
+        idle voice is taken, or the oldest sounding note is stolen if none is idle.
+        
+        Args:
+            note: MIDI note number (0-127)
+            velocity: MIDI velocity (0-127)
+        """
+        voices = self._note_voices
+        particle = voices.pop(note, None)
+        if particle is None:
+            if self._free_voices:
+                particle = self._free_voices.popleft()
+            else:
+                _, particle = voices.popitem(last=False)
+        voices[note] = particle
+        particle.play_note(note, velocity)
+    
+    def _release_voice(self, note):
+        """Release the voice holding a note and return it to the idle pool."""
+        particle = self._note_voices.pop(note, None)
+        if particle is not None:
+            particle.stop_note()
+            self._free_voices.append(particle)
+    
+    def _voice_aftertouch(self, note, value):
+        """Apply curve-mapped aftertouch to the voice holding a note."""
+        particle = self._note_voices.get(note)
+        if particle is not None:
+            particle.set_aftertouch(value)
+    
+    def _sync_voices(self):
+        """Apply the first voice's parameters to the other voices if they changed."""
+        preset_data = self.particles[0]._collect_preset_dict()
+        preset_hash = hash(repr(preset_data))
+        if preset_hash != self._lead_hash:
+            self._lead_hash = preset_hash
+            for particle in self.particles[1:]:
+                particle.apply_preset(preset_data)
     
     def setup_gui(self):
         """
@@ -1081,141 +1810,174 @@ class CaelusSynth:
         pass
 
 
-# Example preset that includes pan LFO settings
-default_preset = """
-particle1:
-  op1:
-    ratio: 3.0
-    index: 3.0
-    freq_offset: 0.0
-    phase: 0.0
-    freq_env:
-      attack: 0.005
-      decay: 1.5
-      sustain: 0.1
-      release: 0.8
-      mul: 1.0
-    amp_env:
-      attack: 0.001
-      decay: 0.1
-      sustain: 0.7
-      release: 0.5
-      mul: 1.0
-    freq_delay: 0.0
-    depth_delay: 0.0
-    freq_ramp:
-      start: 0.0
-      end: 0.0
-      time: 1.0
-    amp_ramp:
-      start: 1.0
-      end: 0.5
-      time: 1.2
-    feedback:
-      amount: 0.3
-      gain: 0.7
-      frequency: 20.0
-    delay:
-      dry_wet: 0.2
-      time: [0.12, 0.24, 0.36]
-      feedback: 0.3
-    pan_lfo:
-      active: 1.0
-      center: 0.5
-      freq: 0.2
-      depth: 0.5
-      phase: 0.0
-  op2:
-    ratio: 1.0
-    index: 2.5
-    freq_offset: 0.0
-    phase: 0.25
-    freq_env:
-      attack: 0.01
-      decay: 0.8
-      sustain: 0.4
-      release: 0.6
-      mul: 1.0
-    amp_env:
-      attack: 0.001
-      decay: 0.2
-      sustain: 0.6
-      release: 0.4
-      mul: 0.8
-    freq_delay: 0.01
-    depth_delay: 0.01
-    freq_ramp:
-      start: 0.0
-      end: 0.0
-      time: 1.0
-    amp_ramp:
-      start: 1.0
-      end: 0.7
-      time: 0.9
-    feedback:
-      amount: 0.4
-      gain: 0.5
-      frequency: -15.0
-    delay:
-      dry_wet: 0.15
-      time: [0.08, 0.16, 0.24]
-      feedback: 0.4
-    pan_lfo:
-      active: 1.0
-      center: 0.3
-      freq: 0.15
-      depth: 0.4
-      phase: 0.5
-  carrier:
-    ratio: 1.0
-    index: 0.0
-    freq_offset: 0.0
-    phase: 0.0
-    freq_env:
-      attack: 0.01
-      decay: 0.1
-      sustain: 0.8
-      release: 0.5
-      mul: 1.0
-    amp_env:
-      attack: 0.01
-      decay: 0.1
-      sustain: 0.8
-      release: 0.5
-      mul: 0.15
-    freq_delay: 0.0
-    depth_delay: 0.0
-    freq_ramp:
-      start: 0.0
-      end: 0.0
-      time: 1.5
-    amp_ramp:
-      start: 1.0
-      end: 0.8
-      time: 1.5
-    feedback:
-      amount: 0.2
-      gain: 0.6
-      frequency: 0.0
-    delay:
-      dry_wet: 0.35
-      time: [0.25, 0.5, 0.75]
-      feedback: 0.5
-    pan_lfo:" \
-    """
+# Example preset that includes pan LFO settings, kept as a Python literal so a
+# first run needs no YAML parse; the first save writes it to disk
+DEFAULT_PRESET = {
+    "particle1": {
+        "op1": {
+            "ratio": 3.0,
+            "index": 3.0,
+            "freq_offset": 0.0,
+            "phase": 0.0,
+            "freq_env": {
+                "attack": 0.005,
+                "decay": 1.5,
+                "sustain": 0.1,
+                "release": 0.8,
+                "mul": 1.0,
+            },
+            "amp_env": {
+                "attack": 0.001,
+                "decay": 0.1,
+                "sustain": 0.7,
+                "release": 0.5,
+                "mul": 1.0,
+            },
+            "freq_delay": 0.0,
+            "depth_delay": 0.0,
+            "freq_ramp": {
+                "start": 0.0,
+                "end": 0.0,
+                "time": 1.0,
+            },
+            "amp_ramp": {
+                "start": 1.0,
+                "end": 0.5,
+                "time": 1.2,
+            },
+            "feedback": {
+                "amount": 0.3,
+                "gain": 0.7,
+                "frequency": 20.0,
+            },
+            "delay": {
+                "dry_wet": 0.2,
+                "time": [0.12, 0.24, 0.36],
+                "feedback": 0.3,
+            },
+            "pan_lfo": {
+                "active": 1.0,
+                "center": 0.5,
+                "freq": 0.2,
+                "depth": 0.5,
+                "phase": 0.0,
+            },
+        },
+        "op2": {
+            "ratio": 1.0,
+            "index": 2.5,
+            "freq_offset": 0.0,
+            "phase": 0.25,
+            "freq_env": {
+                "attack": 0.01,
+                "decay": 0.8,
+                "sustain": 0.4,
+                "release": 0.6,
+                "mul": 1.0,
+            },
+            "amp_env": {
+                "attack": 0.001,
+                "decay": 0.2,
+                "sustain": 0.6,
+                "release": 0.4,
+                "mul": 0.8,
+            },
+            "freq_delay": 0.01,
+            "depth_delay": 0.01,
+            "freq_ramp": {
+                "start": 0.0,
+                "end": 0.0,
+                "time": 1.0,
+            },
+            "amp_ramp": {
+                "start": 1.0,
+                "end": 0.7,
+                "time": 0.9,
+            },
+            "feedback": {
+                "amount": 0.4,
+                "gain": 0.5,
+                "frequency": -15.0,
+            },
+            "delay": {
+                "dry_wet": 0.15,
+                "time": [0.08, 0.16, 0.24],
+                "feedback": 0.4,
+            },
+            "pan_lfo": {
+                "active": 1.0,
+                "center": 0.3,
+                "freq": 0.15,
+                "depth": 0.4,
+                "phase": 0.5,
+            },
+        },
+        "carrier": {
+            "ratio": 1.0,
+            "index": 0.0,
+            "freq_offset": 0.0,
+            "phase": 0.0,
+            "freq_env": {
+                "attack": 0.01,
+                "decay": 0.1,
+                "sustain": 0.8,
+                "release": 0.5,
+                "mul": 1.0,
+            },
+            "amp_env": {
+                "attack": 0.01,
+                "decay": 0.1,
+                "sustain": 0.8,
+                "release": 0.5,
+                "mul": 0.15,
+            },
+            "freq_delay": 0.0,
+            "depth_delay": 0.0,
+            "freq_ramp": {
+                "start": 0.0,
+                "end": 0.0,
+                "time": 1.5,
+            },
+            "amp_ramp": {
+                "start": 1.0,
+                "end": 0.8,
+                "time": 1.5,
+            },
+            "feedback": {
+                "amount": 0.2,
+                "gain": 0.6,
+                "frequency": 0.0,
+            },
+            "delay": {
+                "dry_wet": 0.35,
+                "time": [0.25, 0.5, 0.75],
+                "feedback": 0.5,
+            },
+            "pan_lfo": {
+                "active": 0.0,
+                "center": 0.5,
+                "freq": 0.2,
+                "depth": 0.5,
+                "phase": 0.0,
+            },
+        },
+    },
+}
+
+
 # Run the synthesizer
 if __name__ == "__main__":
+    # Show preset and MIDI status messages on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Create presets directory if it doesn't exist
-    if not os.path.exists("presets"):
-        os.makedirs("presets")
+    os.makedirs("presets", exist_ok=True)
     
-    # Create default preset file if it doesn't exist
+    # The default pan LFO preset is applied from memory until the file exists;
+    # saving on exit creates it
     default_preset_path = "presets/default_pan_lfo.yaml"
-    if not os.path.exists(default_preset_path):
-        with open(default_preset_path, "w") as f:
-            f.write(default_preset)
-        print(f"Created default preset at {default_preset_path}")
     
-    # Initialize with just one particle and the default pan LFO preset
-    synth = Particle(preset_file=default_preset_path)
+    # Initialize with just one particle and the default pan LFO preset; the
+    # particle boots and starts the one audio server of the process
+    synth = Particle(preset_file=default_preset_path, defaults=DEFAULT_PRESET)
     synth.s.gui(locals())
\ No newline at end of file
@@ -8,12 +8,17 @@ import time
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QSlider, QVBoxLayout, 
                            QHBoxLayout, QLabel, QWidget, QGroupBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QKeyEvent
 
 # Audio playback
 from pyo import *
 
+# MIDI note -> Hz and 7-bit value -> 0-1 lookup tables (as in caelus.py)
+_MIDI_TO_HZ = tuple(440.0 * 2.0 ** ((n - 69) / 12.0) for n in range(128))
+_MIDI_NORM = tuple(v / 127.0 for v in range(128))
+
+
 class CaeluxController:
     def __init__(self, worker_ip="127.0.0.1", worker_port=9004, listen_port=9003):
         # OSC client to send messages to worker
@@ -91,9 +96,9 @@ class CaeluxController:
         print(f"CONTROLLER: Received MIDI message: {msg}")
         
         if msg.type == 'note_on' and msg.velocity > 0:
-            # Convert MIDI note to frequency (A4 = 69 = 440Hz)
-            freq = 440.0 * (2 ** ((msg.note - 69) / 12))
-            vel = msg.velocity / 127.0
+            # Convert MIDI note and velocity with the precomputed lookup tables
+            freq = _MIDI_TO_HZ[msg.note]
+            vel = _MIDI_NORM[msg.velocity]
             
             # Send note_on to worker
             print(f"CONTROLLER: Sending note ON to worker: freq={freq}, vel={vel}")
@@ -111,14 +116,14 @@ class CaeluxController:
             # Only process polytouch for currently playing note
             if msg.note == self.current_note:
                 # Normalize value to 0-1 range
-                touch_val = msg.value / 127.0
+                touch_val = _MIDI_NORM[msg.value]
                 print(f"CONTROLLER: Sending polytouch: {touch_val:.2f}")
                 self.osc_client.send_message("/touch", [touch_val])
     
     def simulate_note_on(self, note=60, velocity=100):
         """Simulate a MIDI note for testing without a MIDI device"""
-        freq = 440.0 * (2 ** ((note - 69) / 12))
-        vel = velocity / 127.0
+        freq = _MIDI_TO_HZ[note]
+        vel = _MIDI_NORM[velocity]
         print(f"CONTROLLER: Simulating note ON: {note} (freq={freq:.1f}, vel={vel:.2f})")
         self.osc_client.send_message("/note", [freq, vel])
         self.current_note = note
@@ -148,6 +153,14 @@ class ControllerGUI(QMainWindow):
         main_widget = QWidget()
         main_layout = QVBoxLayout()
         
+        # Slider drags emit a burst of valueChanged signals; restart a short
+        # single-shot timer on each one and only send the latest ADSR values
+        # once the burst settles (~8 ms), instead of one OSC packet per tick
+        self._adsr_timer = QTimer(self)
+        self._adsr_timer.setSingleShot(True)
+        self._adsr_timer.setInterval(8)
+        self._adsr_timer.timeout.connect(self.update_adsr)
+        
         # ADSR controls
         adsr_group = QGroupBox("ADSR Envelope")
         adsr_layout = QHBoxLayout()
@@ -157,7 +170,7 @@ class ControllerGUI(QMainWindow):
         self.attack_slider = QSlider(Qt.Vertical)
         self.attack_slider.setRange(1, 1000)  # 1ms to 1000ms
         self.attack_slider.setValue(10)  # Default 10ms
-        self.attack_slider.valueChanged.connect(self.update_adsr)
+        self.attack_slider.valueChanged.connect(self.schedule_adsr_update)
         attack_layout.addWidget(self.attack_slider)
         attack_layout.addWidget(QLabel("Attack"))
         adsr_layout.addLayout(attack_layout)
@@ -167,7 +180,7 @@ class ControllerGUI(QMainWindow):
         self.decay_slider = QSlider(Qt.Vertical)
         self.decay_slider.setRange(1, 1000)  # 1ms to 1000ms
         self.decay_slider.setValue(100)  # Default 100ms
-        self.decay_slider.valueChanged.connect(self.update_adsr)
+        self.decay_slider.valueChanged.connect(self.schedule_adsr_update)
         decay_layout.addWidget(self.decay_slider)
         decay_layout.addWidget(QLabel("Decay"))
         adsr_layout.addLayout(decay_layout)
@@ -177,7 +190,7 @@ class ControllerGUI(QMainWindow):
         self.sustain_slider = QSlider(Qt.Vertical)
         self.sustain_slider.setRange(0, 100)  # 0% to 100%
         self.sustain_slider.setValue(70)  # Default 70%
-        self.sustain_slider.valueChanged.connect(self.update_adsr)
+        self.sustain_slider.valueChanged.connect(self.schedule_adsr_update)
         sustain_layout.addWidget(self.sustain_slider)
         sustain_layout.addWidget(QLabel("Sustain"))
         adsr_layout.addLayout(sustain_layout)
@@ -187,7 +200,7 @@ class ControllerGUI(QMainWindow):
         self.release_slider = QSlider(Qt.Vertical)
         self.release_slider.setRange(1, 1000)  # 1ms to 1000ms
         self.release_slider.setValue(500)  # Default 500ms
-        self.release_slider.valueChanged.connect(self.update_adsr)
+        self.release_slider.valueChanged.connect(self.schedule_adsr_update)
         release_layout.addWidget(self.release_slider)
         release_layout.addWidget(QLabel("Release"))
         adsr_layout.addLayout(release_layout)
@@ -205,6 +218,10 @@ class ControllerGUI(QMainWindow):
         # Initial ADSR update
         self.update_adsr()
     
+    def schedule_adsr_update(self):
+        """Coalesce slider changes into one ADSR update when the timer fires"""
+        self._adsr_timer.start()
+    
     def update_adsr(self):
         """Send ADSR values to the controller"""
         attack = self.attack_slider.value() / 1000.0  # Convert to seconds
@@ -8,6 +8,10 @@ from PyQt5.QtCore import Qt, QTimer
 import sys
 import time
 
+# MIDI note -> Hz and 7-bit value -> 0-1 lookup tables (as in caelus.py)
+_MIDI_TO_HZ = tuple(440.0 * 2.0 ** ((n - 69) / 12.0) for n in range(128))
+_MIDI_NORM = tuple(v / 127.0 for v in range(128))
+
 
 class MidiController:
     """Handles MIDI input/output functionality"""
@@ -80,11 +84,11 @@ class MidiController:
         print(f"MIDI: {msg}")
         
         if msg.type == 'note_on' and msg.velocity > 0:
-            # Convert MIDI note to frequency (A4 = 69 = 440Hz)
-            freq_val = 440.0 * (2 ** ((msg.note - 69) / 12))
+            # Convert MIDI note to frequency with the precomputed lookup table
+            freq_val = _MIDI_TO_HZ[msg.note]
             
             # Call synth engine note on method
-            self.synth_engine.note_on(freq_val, msg.velocity / 127)
+            self.synth_engine.note_on(freq_val, _MIDI_NORM[msg.velocity])
             self.current_note = msg.note
             self.update_status(f"Playing note: {msg.note} ({freq_val:.1f} Hz)")
             
@@ -11,6 +11,10 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QSlider, QVBoxLayout, QH
                             QRadioButton, QButtonGroup, QDoubleSpinBox, QSpinBox)
 from PyQt5.QtCore import Qt, QTimer
 
+# MIDI note -> Hz and 7-bit value -> 0-1 lookup tables (as in caelus.py)
+_MIDI_TO_HZ = tuple(440.0 * 2.0 ** ((n - 69) / 12.0) for n in range(128))
+_MIDI_NORM = tuple(v / 127.0 for v in range(128))
+
 
 # === NUMBA OPTIMIZED FUNCTIONS ===
 @jit(nopython=True)
@@ -202,13 +206,13 @@ class FMSynthMaster:
     def note_on(self, note, velocity, particle_idx=0):
         """Send note on message to a specific particle"""
         if 0 <= particle_idx < len(self.cmd_queues):
-            # Convert MIDI note to frequency
-            freq = 440.0 * (2 ** ((note - 69) / 12))
+            # Convert MIDI note and velocity with the precomputed lookup tables
+            freq = _MIDI_TO_HZ[note]
             
             self.cmd_queues[particle_idx].put({
                 'cmd': 'note_on',
                 'freq': freq,
-                'vel': velocity / 127.0
+                'vel': _MIDI_NORM[velocity]
             })
             self.current_notes[particle_idx] = note
     
@@ -323,7 +327,7 @@ class MidiController:
             self.current_note = msg.note
             
             # Convert MIDI note to frequency for display
-            freq_val = 440.0 * (2 ** ((msg.note - 69) / 12))
+            freq_val = _MIDI_TO_HZ[msg.note]
             self.update_status(f"Playing note: {msg.note} ({freq_val:.1f} Hz)")
             
         elif msg.type in ['note_off', 'note_on'] and msg.velocity == 0: